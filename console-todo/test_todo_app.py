@@ -0,0 +1,249 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from todo_app import COMPLETED, PENDING, Task, TodoManager
+
+
+class TodoManagerLogTest(unittest.TestCase):
+    """Tests for the snapshot + mutation log storage"""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.storage_file = os.path.join(self.dir, "tasks.json")
+        self.log_file = os.path.join(self.dir, "tasks.log")
+        self.managers = []
+
+    def tearDown(self):
+        for manager in self.managers:
+            manager.close()
+        shutil.rmtree(self.dir)
+
+    def open_manager(self):
+        manager = TodoManager(self.storage_file)
+        self.managers.append(manager)
+        return manager
+
+    def reopen(self, manager):
+        manager.close()
+        return self.open_manager()
+
+    def titles(self, manager):
+        return [task.title for task in manager.list_tasks()]
+
+    def test_replay_restores_mutations(self):
+        manager = self.open_manager()
+        first = manager.add_task("first")
+        second = manager.add_task("second")
+        manager.update_task(first.id, title="renamed")
+        manager.toggle_task_status(first.id)
+        manager.delete_task(second.id)
+
+        manager = self.reopen(manager)
+        self.assertEqual(self.titles(manager), ["renamed"])
+        self.assertEqual(manager.get_task_by_id(first.id).status_str, "completed")
+        self.assertEqual(manager.next_id, 3)
+
+    def test_torn_tail_does_not_swallow_later_records(self):
+        manager = self.open_manager()
+        manager.add_task("first")
+        manager.close()
+        with open(self.log_file, "ab") as f:
+            f.write(b'{"op":"add","task":{"id":')
+
+        manager = self.open_manager()
+        manager.add_task("second")
+        manager.add_task("third")
+
+        manager = self.reopen(manager)
+        self.assertEqual(self.titles(manager), ["first", "second", "third"])
+
+    def test_compact_then_reload(self):
+        manager = self.open_manager()
+        for title in ("one", "two", "three"):
+            manager.add_task(title)
+        manager.delete_task(2)
+        manager.compact()
+        self.assertEqual(os.path.getsize(self.log_file), 0)
+
+        manager = self.reopen(manager)
+        self.assertEqual(self.titles(manager), ["one", "three"])
+        self.assertEqual(manager.next_id, 4)
+
+    def test_failed_save_removes_temp_file_and_keeps_snapshot(self):
+        manager = self.open_manager()
+        manager.add_task("one")
+        manager.compact()
+        manager.add_task("two")
+        with mock.patch.object(TodoManager, "_stream_tasks", side_effect=OSError("disk full")):
+            self.assertFalse(manager.save_tasks())
+        self.assertEqual(sorted(os.listdir(self.dir)), ["tasks.json", "tasks.log"])
+
+        manager = self.reopen(manager)
+        self.assertEqual(self.titles(manager), ["one", "two"])
+
+    def test_replaying_log_over_newer_snapshot_does_not_duplicate(self):
+        # Simulates a crash between writing the snapshot and truncating the log
+        manager = self.open_manager()
+        manager.add_task("one")
+        manager.add_task("two")
+        manager.update_task(1, title="first")
+        manager.flush()
+        manager.save_tasks()
+
+        manager = self.reopen(manager)
+        self.assertEqual([(task.id, task.title) for task in manager.list_tasks()], [(1, "first"), (2, "two")])
+        self.assertEqual(sorted(manager._by_id), [1, 2])
+
+    def test_lone_surrogate_round_trips(self):
+        manager = self.open_manager()
+        manager.add_task("bad \udcff")
+        manager.compact()
+        manager.add_task("also \udcff")
+
+        manager = self.reopen(manager)
+        self.assertEqual(self.titles(manager), ["bad \udcff", "also \udcff"])
+
+    def test_bad_event_is_skipped(self):
+        manager = self.open_manager()
+        manager.add_task("one")
+        manager.close()
+        with open(self.log_file, "ab") as f:
+            f.write(b'{"op":"update","id":1,"fields":{"title":"x","status":"done"}}\n')
+            f.write(b'{"op":"add","task":{"id":2}}\n')
+            f.write(b'{"op":"update","id":1,"fields":{"title":"still one"}}\n')
+
+        manager = self.open_manager()
+        task = manager.get_task_by_id(1)
+        self.assertEqual(self.titles(manager), ["still one"])
+        self.assertEqual(task.status_str, "pending")
+
+    def test_failed_background_write_is_reported_and_retried(self):
+        manager = self.open_manager()
+        manager.add_task("one")
+        manager.close()
+        manager.log_file = self.dir  # appending to a directory fails
+        manager.add_task("two")
+        manager._queue.join()
+        self.assertIsInstance(manager.write_error, OSError)
+
+        # The next mutation succeeds and carries the failed record along with it
+        manager.log_file = self.log_file
+        manager.add_task("three")
+        manager._queue.join()
+        self.assertIsNone(manager.write_error)
+        self.assertEqual(manager._log_events, 3)
+
+        manager = self.reopen(manager)
+        self.assertEqual(self.titles(manager), ["one", "two", "three"])
+
+    def test_partial_append_is_retried_on_a_fresh_line(self):
+        manager = self.open_manager()
+        manager.add_task("one")
+        manager._queue.join()
+        # A failed append that got part of its payload to disk before erroring
+        real_fsync = os.fsync
+        calls = []
+
+        def failing_fsync(fd):
+            if not calls:
+                calls.append(fd)
+                with open(self.log_file, "ab") as f:
+                    f.truncate(os.path.getsize(self.log_file) - 10)
+                raise OSError(28, "No space left on device")
+            real_fsync(fd)
+
+        with mock.patch("todo_app.os.fsync", failing_fsync):
+            manager.add_task("two")
+            manager._queue.join()
+        manager.add_task("three")
+
+        manager = self.reopen(manager)
+        self.assertEqual(self.titles(manager), ["one", "two", "three"])
+
+    def test_closed_managers_release_their_writer_threads(self):
+        before = threading.active_count()
+        for _ in range(5):
+            manager = self.open_manager()
+            manager.add_task("one")
+            manager.close()
+        self.assertEqual(threading.active_count(), before)
+
+    def test_read_only_manager_starts_no_writer_thread(self):
+        before = threading.active_count()
+        self.open_manager()
+        self.assertEqual(threading.active_count(), before)
+
+
+class TodoManagerTest(unittest.TestCase):
+    """Tests for in-memory TodoManager behaviour"""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.manager = TodoManager(os.path.join(self.dir, "tasks.json"))
+
+    def tearDown(self):
+        self.manager.close()
+        shutil.rmtree(self.dir)
+
+    def test_filtered_result_can_be_modified_by_caller(self):
+        self.manager.add_task("one")
+        self.manager.list_tasks("pending").clear()
+        self.assertEqual([task.title for task in self.manager.list_tasks("pending")], ["one"])
+
+    def test_filter_follows_status_changes(self):
+        task = self.manager.add_task("one")
+        self.assertEqual(len(self.manager.list_tasks("pending")), 1)
+        self.manager.toggle_task_status(task.id)
+        self.assertEqual(self.manager.list_tasks("pending"), [])
+        self.assertEqual(self.manager.list_tasks("completed"), [task])
+
+    def test_failed_encoding_leaves_state_unchanged(self):
+        task = self.manager.add_task("one")
+        with mock.patch.object(TodoManager, "_encode_event", side_effect=TypeError("boom")):
+            for mutate in (lambda: self.manager.add_task("two"),
+                           lambda: self.manager.update_task(task.id, title="renamed", status="completed"),
+                           lambda: self.manager.toggle_task_status(task.id),
+                           lambda: self.manager.delete_task(task.id)):
+                with self.assertRaises(TypeError):
+                    mutate()
+        self.assertEqual(self.manager.list_tasks(), [task])
+        self.assertEqual((task.title, task.status_str), ("one", "pending"))
+        self.assertEqual(self.manager.next_id, 2)
+
+    def test_deleted_tasks_are_not_reused_by_default(self):
+        old = self.manager.add_task("old")
+        self.manager.delete_task(old.id)
+        new = self.manager.add_task("new")
+        self.assertIsNot(new, old)
+        self.assertEqual((old.id, old.title), (1, "old"))
+
+    def test_pool_reuses_deleted_tasks_when_enabled(self):
+        self.manager.pool_size = 1
+        old = self.manager.add_task("old")
+        self.manager.delete_task(old.id)
+        new = self.manager.add_task("new")
+        self.assertIs(new, old)
+        self.assertEqual((new.id, new.title), (2, "new"))
+
+
+class TaskTest(unittest.TestCase):
+    """Tests for the Task model"""
+
+    def test_status_accepts_names_and_codes(self):
+        self.assertEqual(Task(1, "a", status="completed").status, COMPLETED)
+        self.assertEqual(Task(1, "a", status=PENDING).status_str, "pending")
+
+    def test_invalid_status_is_rejected(self):
+        with self.assertRaises(ValueError):
+            Task(1, "a", status="done")
+        for status in (2, True, 1.0, None):
+            with self.assertRaises(ValueError):
+                Task(1, "a", status=status)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,17 +1,103 @@
+import atexit
 import json
 import os
+import queue
+import sys
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional
+from operator import itemgetter
+from typing import List, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+# Task status codes; the names are only used at the UI and storage boundaries
+PENDING = 0
+COMPLETED = 1
+STATUS_NAMES = ("pending", "completed")
+_STATUS_CODES = {name: code for code, name in enumerate(STATUS_NAMES)}
+
+# Pulls a task's stored fields out of its dict in one call, in Task.__init__ order
+_task_fields = itemgetter("id", "title", "description", "status", "created_at")
+
+# Number of logged mutations after which the log is folded into the snapshot
+COMPACT_THRESHOLD = 1000
+
+
+def _dumps(data, pretty: bool = False, default=None) -> bytes:
+    """Serialize data to JSON bytes, using orjson when it is available
+
+    ``default`` converts objects the encoder does not know about, such as Task.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except orjson.JSONEncodeError:
+            # orjson rejects some values the stdlib accepts, e.g. lone surrogates
+            # from input() under surrogateescape; let the stdlib encode those
+            pass
+    if pretty:
+        return json.dumps(data, default=default, indent=2).encode()
+    return json.dumps(data, default=default, separators=(',', ':')).encode()
+
+
+def _loads(raw: bytes):
+    """Parse JSON bytes, using orjson when it is available"""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # May be valid JSON orjson refuses, such as the escaped lone surrogates
+            # the stdlib fallback in _dumps writes; the stdlib raises if it is not
+            pass
+    return json.loads(raw)
+
+def _file_stat(path: str):
+    """Return (mtime_ns, size) for a file, or None if it does not exist"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _fsync_dir(path: str):
+    """Flush a file's directory entry to disk so a rename into it survives a crash"""
+    if not hasattr(os, "O_DIRECTORY"):
+        # Windows can't open directories; its rename is already durable
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
 
 class Task:
     """Represents a single todo task"""
 
-    def __init__(self, task_id: int, title: str, description: str = "", status: str = "pending"):
+    __slots__ = ("id", "title", "description", "status", "created_at", "_json_cache")
+
+    def __init__(self, task_id: int, title: str, description: str = "", status: Union[int, str] = PENDING,
+                 created_at: Optional[str] = None):
         self.id = task_id
         self.title = title
         self.description = description
-        self.status = status  # "pending" or "completed"
-        self.created_at = datetime.now().isoformat()
+        # PENDING or COMPLETED; status names are still accepted and converted here
+        if isinstance(status, str):
+            if status not in _STATUS_CODES:
+                raise ValueError("Status must be 'pending' or 'completed'")
+            status = _STATUS_CODES[status]
+        elif type(status) is not int or status not in (PENDING, COMPLETED):
+            # type() rather than isinstance(): True and 1.0 compare equal to the codes
+            raise ValueError("Status must be PENDING or COMPLETED")
+        self.status = status
+        # Only stamp the current time for new tasks; loaded tasks keep their own
+        self.created_at = created_at if created_at is not None else datetime.now().isoformat()
+        self._json_cache: Optional[bytes] = None
 
     def to_dict(self) -> Dict:
         """Convert task to dictionary for JSON serialization"""
@@ -19,33 +105,69 @@ class Task:
             "id": self.id,
             "title": self.title,
             "description": self.description,
-            "status": self.status,
+            "status": self.status_str,
             "created_at": self.created_at
         }
 
+    @property
+    def status_str(self) -> str:
+        """Status name used for display and storage ("pending" or "completed")"""
+        return STATUS_NAMES[self.status]
+
+    def to_json_bytes(self) -> bytes:
+        """Return the task serialized as JSON, reusing the cached encoding if unchanged"""
+        if self._json_cache is None:
+            self._json_cache = _dumps(self.to_dict())
+        return self._json_cache
+
+    def invalidate(self):
+        """Drop the cached JSON encoding after the task has been modified"""
+        self._json_cache = None
+
     @classmethod
     def from_dict(cls, data: Dict):
         """Create Task instance from dictionary"""
-        task = cls(data["id"], data["title"], data["description"], data["status"])
-        task.created_at = data["created_at"]
-        return task
+        return cls(data["id"], data["title"], data["description"], _STATUS_CODES[data["status"]],
+                   created_at=data["created_at"])
 
 class TodoManager:
     """Manages todo tasks with file-based storage"""
 
-    def __init__(self, storage_file: str = "tasks.json"):
+    def __init__(self, storage_file: str = "tasks.json", pretty: bool = False, pool_size: int = 0):
         self.storage_file = storage_file
+        self.pretty = pretty  # indent the snapshot file for human readers
+        # How many deleted Task objects add_task may reuse. Off by default: a reused
+        # object changes under anyone still holding a reference to the deleted task.
+        self.pool_size = pool_size
+        self.log_file = os.path.splitext(storage_file)[0] + ".log"
         self.tasks: List[Task] = []
+        self._by_id: Dict[int, Task] = {}
+        self._filter_cache: Dict[int, List[Task]] = {}  # list_tasks results per status code
+        self._pool: List[Task] = []  # deleted tasks available for reuse
         self.next_id = 1
+        self.autosave = True  # write each mutation as soon as it is made
+        self._log = None
+        self._log_events = 0
+        self._pending: List[bytes] = []  # log records not yet written
+        self._dirty = False
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._write_error: Optional[Exception] = None  # set by the writer when an append fails
+        # Last failed background write while its records are still being retried; None once saved
+        self.write_error: Optional[Exception] = None
+        self._unwritten: List[bytes] = []  # payloads the writer could not append, in order
+        # File stats as of the last load or own write, used by reload_if_changed
+        self._snapshot_stat = None
+        self._log_stat = None
         self.load_tasks()
 
     def load_tasks(self):
-        """Load tasks from the storage file"""
+        """Load tasks from the storage file, then replay the mutation log"""
         if os.path.exists(self.storage_file):
             try:
-                with open(self.storage_file, 'r') as f:
-                    data = json.load(f)
-                    self.tasks = [Task.from_dict(task_data) for task_data in data.get("tasks", [])]
+                with open(self.storage_file, 'rb') as f:
+                    data = _loads(f.read())
+                    self.tasks = self._build_tasks(data.get("tasks", []))
                     self.next_id = data.get("next_id", 1)
             except (json.JSONDecodeError, KeyError):
                 print("Error loading tasks. Starting with empty task list.")
@@ -54,28 +176,326 @@ class TodoManager:
         else:
             self.tasks = []
             self.next_id = 1
+        self._by_id = {task.id: task for task in self.tasks}
+
+        self._log_events = self._replay_log()
+        self._filter_cache.clear()
+        self._snapshot_stat = _file_stat(self.storage_file)
+        self._log_stat = _file_stat(self.log_file)
+        if self._log_events > COMPACT_THRESHOLD:
+            self.compact()
+
+    def reload_if_changed(self) -> bool:
+        """Reload tasks if the storage files changed on disk since they were last read or written"""
+        # Our own queued writes must land first, or they would look like outside changes
+        self.flush()
+        self._queue.join()
+        if (_file_stat(self.storage_file), _file_stat(self.log_file)) == (self._snapshot_stat, self._log_stat):
+            return False
+        self.load_tasks()
+        return True
+
+    @staticmethod
+    def _build_tasks(rows: List[Dict]) -> List[Task]:
+        """Rebuild Task objects from stored dicts, bypassing __init__ in the bulk-load loop"""
+        new_task = Task.__new__
+        status_codes = _STATUS_CODES
+        tasks = []
+        for row in rows:
+            task = new_task(Task)
+            task.id, task.title, task.description, status, task.created_at = _task_fields(row)
+            task.status = status_codes[status]
+            task._json_cache = None
+            tasks.append(task)
+        return tasks
+
+    def _replay_log(self) -> int:
+        """Apply the events recorded in the log file, returning how many were applied"""
+        if not os.path.exists(self.log_file):
+            return 0
 
-    def save_tasks(self):
-        """Save tasks to the storage file"""
-        data = {
-            "tasks": [task.to_dict() for task in self.tasks],
-            "next_id": self.next_id
-        }
+        with open(self.log_file, 'rb') as f:
+            raw = f.read()
+
+        if raw and not raw.endswith(b"\n"):
+            # A torn final record from an interrupted write. Cut it off so the next
+            # append starts on a fresh line instead of being glued onto the fragment.
+            good = raw.rfind(b"\n") + 1
+            print("Discarding incomplete record at the end of the task log.")
+            try:
+                with open(self.log_file, 'r+b') as f:
+                    f.truncate(good)
+            except OSError as e:
+                print(f"Error repairing task log: {e}")
+            raw = raw[:good]
+
+        count = 0
+        for line in raw.splitlines():
+            if not line.strip():
+                # Blank lines are left behind when an append is retried after a failure
+                continue
+            try:
+                event = _loads(line)
+                self._apply_event(event)
+            except (ValueError, KeyError, TypeError, AttributeError):
+                print("Skipping unreadable record in the task log.")
+                continue
+            count += 1
+        return count
+
+    def _apply_event(self, event: Dict):
+        """Apply a single logged mutation to the in-memory task list"""
+        op = event["op"]
+        if op == "add":
+            task = Task.from_dict(event["task"])
+            self.next_id = max(self.next_id, task.id + 1)
+            # The snapshot may already contain this task if the log was not cut after
+            # the last compaction; the events that follow bring it up to date either way
+            if task.id not in self._by_id:
+                self.tasks.append(task)
+                self._by_id[task.id] = task
+            return
+
+        task = self.get_task_by_id(event["id"])
+        if not task:
+            return
+        if op == "update":
+            # Convert everything before touching the task so a bad record changes nothing
+            changes = {}
+            for field, value in event["fields"].items():
+                if field not in ("title", "description", "status"):
+                    raise KeyError(field)
+                changes[field] = _STATUS_CODES[value] if field == "status" else value
+            for field, value in changes.items():
+                setattr(task, field, value)
+            task.invalidate()
+        elif op == "delete":
+            self.tasks.remove(task)
+            del self._by_id[task.id]
+
+    @staticmethod
+    def _encode_event(event: Dict) -> bytes:
+        """Encode a mutation record as one log line
+
+        Mutators call this before changing any state, so a record that cannot be
+        encoded leaves both memory and the log untouched.
+        """
+        return _dumps(event) + b"\n"
+
+    def _append_event(self, record: bytes):
+        """Queue a single encoded mutation record for the log file"""
+        # Every mutation passes through here, so this is where cached views go stale
+        self._filter_cache.clear()
+        self._pending.append(record)
+        self._dirty = True
+        if self.autosave:
+            self.flush()
+
+    def flush(self):
+        """Hand all queued mutation records to the background writer as one write
+
+        If an earlier background write failed, the records it could not write are
+        queued again ahead of the new ones. The failure stays in write_error until
+        a write succeeds; it is not raised, since the caller's own change is
+        already applied.
+        """
+        # Retried payloads were counted when first queued; only count new records
+        new_records = len(self._pending)
+        if self._write_error is not None:
+            # Let the writer set aside everything queued behind the failed payload,
+            # so the retry keeps the records in their original order
+            self._queue.join()
+            self._write_error = None
+            self._pending[:0] = self._unwritten
+            self._unwritten = []
+            self._dirty = True
+        if not self._dirty:
+            return
+        if self._writer is None:
+            self._start_writer()
+        self._queue.put(b"".join(self._pending))
+        self._log_events += new_records
+        self._pending = []
+        self._dirty = False
+
+        if self._log_events > COMPACT_THRESHOLD:
+            self.compact()
+
+    def _start_writer(self):
+        """Start the daemon thread that appends log records off the caller's thread
+
+        Started on the first flush, so managers that never write don't own a thread;
+        close() stops it and drops the atexit hook that would keep the manager alive.
+        """
+        self._writer = threading.Thread(target=self._writer_loop, name="todo-log-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self._close_at_exit)
+
+    def _close_at_exit(self):
+        """atexit hook that closes the manager, reporting write errors instead of raising"""
         try:
-            with open(self.storage_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self.close()
         except Exception as e:
             print(f"Error saving tasks: {e}")
 
+    def _writer_loop(self):
+        """Append each queued payload to the log file until a None sentinel arrives"""
+        # Set after a failed append, which may have left a partial line in the log
+        torn = False
+        while True:
+            payload = self._queue.get()
+            try:
+                if payload is None:
+                    return
+                if self._write_error is not None:
+                    # Hold later records back until flush() retries the failed one
+                    self._unwritten.append(payload)
+                    continue
+                if self._log is None:
+                    # Buffered, so a short write by the OS is retried until the whole payload is out
+                    self._log = open(self.log_file, 'ab')
+                if torn:
+                    # End the partial line first so the retried records start on a line of their own
+                    self._log.write(b"\n")
+                self._log.write(payload)
+                self._log.flush()
+                os.fsync(self._log.fileno())
+                torn = False
+                self._log_stat = _file_stat(self.log_file)
+                self.write_error = None
+            except Exception as e:
+                self._unwritten.append(payload)
+                self._write_error = self.write_error = e
+                torn = True
+                # Retry on a fresh handle; whatever the old one still buffered is in the retried payload
+                if self._log is not None:
+                    try:
+                        self._log.close()
+                    except Exception:
+                        pass
+                    self._log = None
+            finally:
+                self._queue.task_done()
+
+    @contextmanager
+    def batch(self):
+        """Context manager that groups the mutations made inside it into a single log write"""
+        autosave = self.autosave
+        self.autosave = False
+        try:
+            yield self
+        finally:
+            self.autosave = autosave
+            self.flush()
+
+    def compact(self):
+        """Fold the mutation log into the snapshot file and truncate the log"""
+        if not self.save_tasks():
+            # Keep the log: it is still the only durable copy of the recent mutations
+            self.flush()
+            return
+        # The snapshot already reflects any queued records
+        self._pending = []
+        self._dirty = False
+        # Let the writer finish appending before the log is cut, so no old records land after it
+        self._queue.join()
+        # Records the writer failed to append are covered by the snapshot as well
+        self._unwritten = []
+        self._write_error = self.write_error = None
+        try:
+            if self._log is not None:
+                self._log.truncate(0)
+            elif os.path.exists(self.log_file):
+                os.remove(self.log_file)
+            self._log_events = 0
+            self._log_stat = _file_stat(self.log_file)
+        except Exception as e:
+            print(f"Error compacting task log: {e}")
+
+    def close(self):
+        """Write any queued mutations, stop the writer thread and close the log file
+
+        Raises the error from a failed background write, since those mutations
+        did not reach the log.
+        """
+        try:
+            self.flush()
+        finally:
+            if self._writer is not None:
+                self._queue.put(None)
+                self._writer.join()
+                self._writer = None
+                atexit.unregister(self._close_at_exit)
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            self.write_error = None
+            raise error
+
+    def save_tasks(self) -> bool:
+        """Save tasks to the storage file, returning whether the save succeeded"""
+        # Write to a temporary file and swap it in, so a failed save never truncates the old snapshot
+        tmp_file = self.storage_file + ".tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                if self.pretty:
+                    data = {"tasks": self.tasks, "next_id": self.next_id}
+                    f.write(_dumps(data, pretty=True, default=Task.to_dict))
+                else:
+                    self._stream_tasks(f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.storage_file)
+            _fsync_dir(self.storage_file)
+            self._snapshot_stat = _file_stat(self.storage_file)
+        except Exception as e:
+            print(f"Error saving tasks: {e}")
+            try:
+                os.remove(tmp_file)
+            except FileNotFoundError:
+                pass
+            except OSError as cleanup_error:
+                print(f"Error removing {tmp_file}: {cleanup_error}")
+            return False
+        return True
+
+    def _stream_tasks(self, f):
+        """Write the snapshot one task at a time, reusing each task's cached encoding"""
+        f.write(b'{"tasks":[')
+        first = True
+        for task in self.tasks:
+            if not first:
+                f.write(b',')
+            f.write(task.to_json_bytes())
+            first = False
+        f.write(b'],"next_id":%d}' % self.next_id)
+
     def add_task(self, title: str, description: str = "") -> Task:
         """Add a new task"""
         if not title.strip():
             raise ValueError("Task title cannot be empty")
 
-        task = Task(self.next_id, title.strip(), description.strip())
+        data = {
+            "id": self.next_id,
+            "title": title.strip(),
+            "description": description.strip(),
+            "status": STATUS_NAMES[PENDING],
+            "created_at": datetime.now().isoformat()
+        }
+        record = self._encode_event({"op": "add", "task": data})
+
+        args = (data["id"], data["title"], data["description"], PENDING, data["created_at"])
+        if self._pool:
+            task = self._pool.pop()
+            task.__init__(*args)
+        else:
+            task = Task(*args)
         self.tasks.append(task)
+        self._by_id[task.id] = task
         self.next_id += 1
-        self.save_tasks()
+        self._append_event(record)
         return task
 
     def update_task(self, task_id: int, title: Optional[str] = None, description: Optional[str] = None, status: Optional[str] = None):
@@ -84,37 +504,63 @@ class TodoManager:
         if not task:
             raise ValueError(f"Task with ID {task_id} not found")
 
+        if status is not None and status not in _STATUS_CODES:
+            raise ValueError("Status must be 'pending' or 'completed'")
+
+        fields = {}
         if title is not None:
-            task.title = title.strip()
+            fields["title"] = title.strip()
         if description is not None:
-            task.description = description.strip()
+            fields["description"] = description.strip()
         if status is not None:
-            if status not in ["pending", "completed"]:
-                raise ValueError("Status must be 'pending' or 'completed'")
-            task.status = status
+            fields["status"] = status
+        record = self._encode_event({"op": "update", "id": task_id, "fields": fields})
 
-        self.save_tasks()
+        if title is not None:
+            task.title = fields["title"]
+        if description is not None:
+            task.description = fields["description"]
+        if status is not None:
+            task.status = _STATUS_CODES[status]
+        task.invalidate()
+        self._append_event(record)
 
     def delete_task(self, task_id: int):
-        """Delete a task by ID"""
+        """Delete a task by ID
+
+        With pool_size set, the deleted Task object may be reused by a later
+        add_task, so callers must not keep references to tasks they delete.
+        """
         task = self.get_task_by_id(task_id)
         if not task:
             raise ValueError(f"Task with ID {task_id} not found")
 
+        record = self._encode_event({"op": "delete", "id": task_id})
         self.tasks.remove(task)
-        self.save_tasks()
+        del self._by_id[task_id]
+        self._append_event(record)
+        if len(self._pool) < self.pool_size:
+            # Drop the text fields so pooled tasks don't keep them alive
+            task.title = task.description = ""
+            task.invalidate()
+            self._pool.append(task)
 
     def get_task_by_id(self, task_id: int) -> Optional[Task]:
         """Get a task by its ID"""
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._by_id.get(task_id)
 
     def list_tasks(self, status_filter: Optional[str] = None) -> List[Task]:
         """List all tasks, optionally filtered by status"""
         if status_filter:
-            return [task for task in self.tasks if task.status == status_filter]
+            code = _STATUS_CODES.get(status_filter)
+            if code is None:
+                return []
+            tasks = self._filter_cache.get(code)
+            if tasks is None:
+                tasks = [task for task in self.tasks if task.status == code]
+                self._filter_cache[code] = tasks
+            # Hand out a copy so callers can't corrupt the cached result
+            return list(tasks)
         return self.tasks
 
     def toggle_task_status(self, task_id: int):
@@ -123,8 +569,11 @@ class TodoManager:
         if not task:
             raise ValueError(f"Task with ID {task_id} not found")
 
-        task.status = "completed" if task.status == "pending" else "pending"
-        self.save_tasks()
+        status = COMPLETED if task.status == PENDING else PENDING
+        record = self._encode_event({"op": "update", "id": task_id, "fields": {"status": STATUS_NAMES[status]}})
+        task.status = status
+        task.invalidate()
+        self._append_event(record)
 
 
 def display_menu():
@@ -147,9 +596,14 @@ def get_user_choice():
     """Get and validate user choice from menu"""
     while True:
         try:
-            choice = input("Enter your choice (0-7): ").strip()
-            if choice in [str(i) for i in range(8)]:
-                return int(choice)
+            print("Enter your choice (0-7): ", end="", flush=True)
+            line = sys.stdin.readline()
+            if not line:
+                # End of input: treat it like choosing Exit
+                return 0
+            choice = line.strip()
+            if len(choice) == 1 and "0" <= choice <= "7":
+                return ord(choice) - ord("0")
             else:
                 print("Invalid choice. Please enter a number between 0 and 7.")
         except KeyboardInterrupt:
@@ -157,6 +611,12 @@ def get_user_choice():
             return 0
 
 
+def report_write_error(todo_manager: TodoManager):
+    """Warn the user when earlier changes are still waiting to be saved"""
+    if todo_manager.write_error is not None:
+        print(f"! Earlier changes not yet saved ({todo_manager.write_error}), retrying.")
+
+
 def add_task_ui(todo_manager: TodoManager):
     """UI for adding a task"""
     print("\n--- ADD TASK ---")
@@ -171,6 +631,7 @@ def add_task_ui(todo_manager: TodoManager):
     try:
         task = todo_manager.add_task(title, description)
         print(f"✓ Task added successfully! (ID: {task.id})")
+        report_write_error(todo_manager)
     except ValueError as e:
         print(f"Error: {e}")
 
@@ -191,10 +652,10 @@ def list_tasks_ui(todo_manager: TodoManager, status_filter: Optional[str] = None
         return
 
     for task in tasks:
-        status_icon = "✓" if task.status == "completed" else "○"
+        status_icon = "✓" if task.status == COMPLETED else "○"
         print(f"\nID: {task.id}")
         print(f"Title: {task.title}")
-        print(f"Status: {status_icon} {task.status}")
+        print(f"Status: {status_icon} {task.status_str}")
         if task.description:
             print(f"Description: {task.description}")
         print("-" * 30)
@@ -218,20 +679,21 @@ def update_task_ui(todo_manager: TodoManager):
 
     print(f"Current task: {task.title}")
     print(f"Current description: {task.description}")
-    print(f"Current status: {task.status}")
+    print(f"Current status: {task.status_str}")
 
     new_title = input(f"Enter new title (or press Enter to keep '{task.title}'): ").strip()
     new_description = input(f"Enter new description (or press Enter to keep current): ").strip()
-    new_status = input(f"Enter new status (pending/completed or press Enter to keep '{task.status}'): ").strip().lower()
+    new_status = input(f"Enter new status (pending/completed or press Enter to keep '{task.status_str}'): ").strip().lower()
 
     # Use current values if user didn't provide new ones
     title = new_title if new_title else None
     description = new_description if new_description else None
-    status = new_status if new_status in ["pending", "completed"] else None
+    status = new_status if new_status in STATUS_NAMES else None
 
     try:
         todo_manager.update_task(task_id, title, description, status)
         print("✓ Task updated successfully!")
+        report_write_error(todo_manager)
     except ValueError as e:
         print(f"Error: {e}")
 
@@ -249,6 +711,7 @@ def delete_task_ui(todo_manager: TodoManager):
     try:
         todo_manager.delete_task(task_id)
         print("✓ Task deleted successfully!")
+        report_write_error(todo_manager)
     except ValueError as e:
         print(f"Error: {e}")
 
@@ -266,11 +729,25 @@ def toggle_task_status_ui(todo_manager: TodoManager):
     try:
         todo_manager.toggle_task_status(task_id)
         task = todo_manager.get_task_by_id(task_id)
-        print(f"✓ Task status updated to: {task.status}")
+        print(f"✓ Task status updated to: {task.status_str}")
+        report_write_error(todo_manager)
     except ValueError as e:
         print(f"Error: {e}")
 
 
+# Menu handlers indexed by choice; None (choice 0) means exit
+_HANDLERS = (
+    None,
+    add_task_ui,
+    list_tasks_ui,
+    update_task_ui,
+    delete_task_ui,
+    toggle_task_status_ui,
+    lambda todo_manager: list_tasks_ui(todo_manager, STATUS_NAMES[PENDING]),
+    lambda todo_manager: list_tasks_ui(todo_manager, STATUS_NAMES[COMPLETED]),
+)
+
+
 def main():
     """Main application loop"""
     print("Welcome to the Console Todo Application!")
@@ -282,23 +759,15 @@ def main():
         display_menu()
         choice = get_user_choice()
 
-        if choice == 0:
+        handler = _HANDLERS[choice]
+        if handler is None:
             print("Thank you for using the Todo Application. Goodbye!")
+            try:
+                todo_manager.close()
+            except OSError as e:
+                print(f"Error saving tasks: {e}")
             break
-        elif choice == 1:
-            add_task_ui(todo_manager)
-        elif choice == 2:
-            list_tasks_ui(todo_manager)
-        elif choice == 3:
-            update_task_ui(todo_manager)
-        elif choice == 4:
-            delete_task_ui(todo_manager)
-        elif choice == 5:
-            toggle_task_status_ui(todo_manager)
-        elif choice == 6:
-            list_tasks_ui(todo_manager, "pending")
-        elif choice == 7:
-            list_tasks_ui(todo_manager, "completed")
+        handler(todo_manager)
 
         input("\nPress Enter to continue...")
 